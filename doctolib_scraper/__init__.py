@@ -0,0 +1,8 @@
+"""
+Scraping des praticiens Doctolib.
+
+Le paquet ne charge aucune dépendance lourde à l'import : Selenium, requests,
+lxml et zstandard ne sont importés que par le moteur qui en a besoin.
+"""
+
+BASE_URL = "https://www.doctolib.fr"
@@ -0,0 +1,4 @@
+from doctolib_scraper.cli import main
+
+if __name__ == "__main__":
+    main()
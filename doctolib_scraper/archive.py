@@ -0,0 +1,154 @@
+import os
+import json
+import hashlib
+from datetime import datetime
+
+INDEX = "index.jsonl"
+OBJETS = "objets"
+DICTIONNAIRES = "dictionnaires"
+COURANT = "courant"
+
+
+class ArchiveHTML:
+    """
+    Archive des pages Doctolib (recherche et fiches), adressée par contenu.
+
+    Chaque page est stockée une seule fois sous son empreinte SHA-256, compressée
+    en zstd. Dès que l'archive contient assez de pages, un dictionnaire est entraîné
+    sur celles-ci (les pages partagent l'essentiel de leur squelette HTML) et toutes
+    les pages sont recompressées avec.
+
+    zstandard n'est importé qu'au premier accès à une page : lire l'index est immédiat.
+    """
+
+    def __init__(self, dossier, taille_echantillon=200, niveau=19):
+        self.dossier = dossier
+        self.taille_echantillon = taille_echantillon
+        self.niveau = niveau
+        self._dictionnaires = {}
+        self._dict_courant = None
+        self._compresseur = None
+        courant = os.path.join(dossier, DICTIONNAIRES, COURANT)
+        if os.path.exists(courant):
+            with open(courant, encoding="utf-8") as f:
+                self._dict_courant = int(f.read().strip())
+
+    # --- chemins ---
+    def _chemin_objet(self, empreinte):
+        return os.path.join(self.dossier, OBJETS, empreinte[:2], empreinte + ".zst")
+
+    def _chemin_dictionnaire(self, dict_id):
+        return os.path.join(self.dossier, DICTIONNAIRES, f"{dict_id}.zdict")
+
+    # --- compression ---
+    def _nouveau_compresseur(self):
+        import zstandard
+        if self._dict_courant is None:
+            return zstandard.ZstdCompressor(level=self.niveau)
+        dictionnaire = self._charger_dictionnaire(self._dict_courant)
+        return zstandard.ZstdCompressor(level=self.niveau, dict_data=dictionnaire)
+
+    def _charger_dictionnaire(self, dict_id):
+        import zstandard
+        if dict_id not in self._dictionnaires:
+            with open(self._chemin_dictionnaire(dict_id), "rb") as f:
+                self._dictionnaires[dict_id] = zstandard.ZstdCompressionDict(f.read())
+        return self._dictionnaires[dict_id]
+
+    def _decompresser(self, donnees):
+        import zstandard
+        # le dictionnaire utilisé est inscrit dans l'en-tête de la trame zstd
+        dict_id = zstandard.get_frame_parameters(donnees).dict_id
+        if dict_id:
+            d = zstandard.ZstdDecompressor(dict_data=self._charger_dictionnaire(dict_id))
+        else:
+            d = zstandard.ZstdDecompressor()
+        return d.decompress(donnees)
+
+    def _ecrire_objet(self, empreinte, brut):
+        chemin = self._chemin_objet(empreinte)
+        os.makedirs(os.path.dirname(chemin), exist_ok=True)
+        if self._compresseur is None:
+            self._compresseur = self._nouveau_compresseur()
+        tmp = chemin + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(self._compresseur.compress(brut))
+        os.replace(tmp, chemin)
+
+    # --- API ---
+    def ajouter(self, url, type_page, html):
+        """Archive une page ('recherche' ou 'fiche') et retourne son empreinte."""
+        brut = html.encode("utf-8")
+        empreinte = hashlib.sha256(brut).hexdigest()
+        if not os.path.exists(self._chemin_objet(empreinte)):
+            self._ecrire_objet(empreinte, brut)
+        entree = {
+            "url": url,
+            "type": type_page,
+            "sha256": empreinte,
+            "date": datetime.now().isoformat(timespec="seconds"),
+        }
+        with open(os.path.join(self.dossier, INDEX), "a", encoding="utf-8") as f:
+            f.write(json.dumps(entree, ensure_ascii=False) + "\n")
+
+        if self._dict_courant is None and self.nb_objets() >= self.taille_echantillon:
+            self.entrainer_dictionnaire()
+        return empreinte
+
+    def lire(self, empreinte):
+        """Retourne le HTML d'une page archivée."""
+        with open(self._chemin_objet(empreinte), "rb") as f:
+            return self._decompresser(f.read()).decode("utf-8")
+
+    def entrees(self, type_page=None):
+        """Parcourt l'index (une entrée par page récupérée, dans l'ordre du crawl)."""
+        chemin = os.path.join(self.dossier, INDEX)
+        if not os.path.exists(chemin):
+            return
+        with open(chemin, encoding="utf-8") as f:
+            for ligne in f:
+                if not ligne.strip():
+                    continue
+                entree = json.loads(ligne)
+                if type_page is None or entree["type"] == type_page:
+                    yield entree
+
+    def empreintes(self):
+        racine = os.path.join(self.dossier, OBJETS)
+        if not os.path.isdir(racine):
+            return
+        for sous_dossier in os.listdir(racine):
+            for nom in os.listdir(os.path.join(racine, sous_dossier)):
+                if nom.endswith(".zst"):
+                    yield nom[:-len(".zst")]
+
+    def nb_objets(self):
+        return sum(1 for _ in self.empreintes())
+
+    def entrainer_dictionnaire(self, taille=112_640, nb_echantillons=2000):
+        """
+        Entraîne un dictionnaire zstd sur (au plus nb_echantillons) pages archivées
+        puis recompresse toutes les pages avec. Les anciens dictionnaires restent sur disque.
+        """
+        import zstandard
+        empreintes = list(self.empreintes())
+        echantillons = [self.lire(e).encode("utf-8") for e in empreintes[:nb_echantillons]]
+        if not echantillons:
+            return None
+        nouveau = zstandard.train_dictionary(taille, echantillons)
+        dict_id = nouveau.dict_id()
+        os.makedirs(os.path.join(self.dossier, DICTIONNAIRES), exist_ok=True)
+        with open(self._chemin_dictionnaire(dict_id), "wb") as f:
+            f.write(nouveau.as_bytes())
+
+        # relire chaque page avec son ancien dictionnaire avant de la réécrire
+        self._dictionnaires[dict_id] = nouveau
+        self._dict_courant = dict_id
+        self._compresseur = self._nouveau_compresseur()
+        for empreinte in empreintes:
+            self._ecrire_objet(empreinte, self.lire(empreinte).encode("utf-8"))
+
+        with open(os.path.join(self.dossier, DICTIONNAIRES, COURANT), "w", encoding="utf-8") as f:
+            f.write(str(dict_id))
+        print(f"✅ Dictionnaire zstd {dict_id} entraîné sur {len(echantillons)} pages")
+        return dict_id
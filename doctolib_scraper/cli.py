@@ -0,0 +1,136 @@
+"""
+Ligne de commande : python -m doctolib_scraper <commande> ...
+
+  crawl REQUETE      récupère les fiches en ligne (moteur selenium ou http)
+  rejouer DOSSIER    relance l'extraction sur une archive HTML, hors ligne
+  resultats [CSV]    affiche / filtre des résultats déjà sauvegardés
+
+Les modules lourds (Selenium, requests, lxml, zstandard) sont importés dans
+les commandes, uniquement quand le moteur choisi en a besoin.
+"""
+import os
+import argparse
+
+# valeurs des options -> valeurs des colonnes CSV
+SECTEURS = {"1": "1", "2": "2", "non-conventionne": "Non conventionné"}
+CONSULTATIONS = {"visio": "Téléconsultation", "cabinet": "En cabinet"}
+
+def entier_positif(valeur):
+    n = int(valeur)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"doit être supérieur ou égal à 1 : {valeur}")
+    return n
+
+def _ouvrir_archive(dossier):
+    if not dossier:
+        return None
+    from doctolib_scraper.archive import ArchiveHTML
+    return ArchiveHTML(dossier)
+
+def _verifier_archive(dossier):
+    from doctolib_scraper.archive import INDEX
+    if not os.path.isfile(os.path.join(dossier, INDEX)):
+        raise SystemExit(f"Archive introuvable (pas de {INDEX}) : {dossier}")
+
+def _sauvegarder(results, args):
+    from doctolib_scraper.stockage import sauvegarder_csv, filtrer
+    results = list(filtrer(results, SECTEURS.get(args.secteur), CONSULTATIONS.get(args.consultation), args.ville))
+    sauvegarder_csv(results, args.sortie)
+    print(f"✅ Terminé — {len(results)} praticiens sauvegardés dans {args.sortie}")
+
+def _collecter(moteur, verbose=False, **criteres):
+    results = []
+    try:
+        for data in moteur.rechercher(**criteres):
+            if verbose:
+                print("DEBUG: extrait ->", data)
+            results.append(data)
+    except KeyboardInterrupt:
+        print("Interrompu par l'utilisateur — sauvegarde partielle.")
+    except Exception as e:
+        print("❌ Erreur pendant la recherche — sauvegarde partielle :", e)
+    return results
+
+def cmd_crawl(args):
+    from doctolib_scraper.moteurs import charger_moteur
+
+    archive = _ouvrir_archive(args.archive)
+    options = {"headless": True} if args.moteur == "selenium" and args.headless else {}
+
+    with charger_moteur(args.moteur)(archive=archive, **options) as moteur:
+        results = _collecter(
+            moteur,
+            verbose=args.verbose,
+            requete=args.requete,
+            lieu=args.lieu,
+            nb_max=args.nb_max,
+            secteur=SECTEURS.get(args.secteur),
+            consultation=CONSULTATIONS.get(args.consultation),
+        )
+    _sauvegarder(results, args)
+
+def cmd_rejouer(args):
+    from doctolib_scraper.moteurs import charger_moteur
+
+    _verifier_archive(args.dossier)
+    moteur = charger_moteur("archive")(_ouvrir_archive(args.dossier), nb_processus=args.processus)
+    with moteur:
+        results = _collecter(moteur, verbose=args.verbose, nb_max=args.nb_max)
+    if not results:
+        raise SystemExit("❌ Aucune fiche ré-extraite, rien n'est sauvegardé.")
+    _sauvegarder(results, args)
+
+def cmd_resultats(args):
+    from doctolib_scraper.stockage import COLONNES, lire_csv, filtrer
+
+    results = list(filtrer(lire_csv(args.fichier), SECTEURS.get(args.secteur),
+                           CONSULTATIONS.get(args.consultation), args.ville))
+    for r in results:
+        print(" | ".join(r.get(k) or "-" for k in COLONNES))
+    print(f"{len(results)} praticien(s)")
+
+def _ajouter_filtres(p):
+    p.add_argument("--secteur", choices=SECTEURS, help="secteur de conventionnement")
+    p.add_argument("--consultation", choices=CONSULTATIONS, help="type de consultation")
+    p.add_argument("--ville", help="mot-clé dans la ville")
+
+def _ajouter_verbose(p):
+    p.add_argument("-v", "--verbose", action="store_true", help="afficher chaque fiche extraite")
+
+def construire_parser():
+    parser = argparse.ArgumentParser(prog="doctolib_scraper", description="Scraping des praticiens Doctolib")
+    sous = parser.add_subparsers(dest="commande", required=True)
+
+    p = sous.add_parser("crawl", help="récupérer des fiches praticiens")
+    p.add_argument("requete", help="requête médicale (ex: dermatologue, généraliste)")
+    p.add_argument("--lieu", help="code postal ou ville (ex: 75001)")
+    p.add_argument("--nb-max", type=int, default=10, help="nombre de résultats maximum (défaut: 10)")
+    # le moteur archive n'a pas de requête : il passe par la commande rejouer
+    p.add_argument("--moteur", choices=["selenium", "http"], default="selenium",
+                   help="pour ré-extraire une archive, utiliser la commande rejouer")
+    p.add_argument("--headless", action="store_true", help="Chrome sans fenêtre (moteur selenium)")
+    p.add_argument("--archive", metavar="DOSSIER", help="archiver les pages HTML dans DOSSIER (relisibles avec rejouer)")
+    p.add_argument("--sortie", default="medecins.csv")
+    _ajouter_filtres(p)
+    _ajouter_verbose(p)
+    p.set_defaults(func=cmd_crawl)
+
+    p = sous.add_parser("rejouer", help="ré-extraire les fiches d'une archive HTML, hors ligne")
+    p.add_argument("dossier", help="dossier de l'archive")
+    p.add_argument("--processus", type=entier_positif, help="nombre de processus (défaut: nombre de cœurs)")
+    p.add_argument("--nb-max", type=int, help="nombre de fiches maximum")
+    p.add_argument("--sortie", default="medecins_rejoues.csv")
+    _ajouter_filtres(p)
+    _ajouter_verbose(p)
+    p.set_defaults(func=cmd_rejouer)
+
+    p = sous.add_parser("resultats", help="afficher des résultats sauvegardés")
+    p.add_argument("fichier", nargs="?", default="medecins.csv")
+    _ajouter_filtres(p)
+    p.set_defaults(func=cmd_resultats)
+
+    return parser
+
+def main(argv=None):
+    args = construire_parser().parse_args(argv)
+    args.func(args)
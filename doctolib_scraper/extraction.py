@@ -0,0 +1,166 @@
+# mêmes valeurs que selenium.webdriver.common.by.By, sans importer Selenium
+class By:
+    ID = "id"
+    CSS_SELECTOR = "css selector"
+    XPATH = "xpath"
+    TAG_NAME = "tag name"
+
+# sélecteurs des cartes résultats sur la page de recherche
+SELECTEURS_CARTES = [
+    "div[data-test-id='search-result-card']",
+    "div[data-testid='search-result-card']",
+    "div[data-test-id*='search-result']",
+    "div[data-testid*='search-result']",
+    "div.dl-card",
+    "li.search-result",
+    "div.search-result-card"
+]
+
+def trouver_url_fiche(med):
+    """Retourne l'URL (relative ou absolue) de la fiche praticien depuis une carte."""
+    selecteurs = [
+        "a[data-testid='practitioner-name']",
+        "a[data-test-id='search-result-card-practitioner-name']",
+        "a[href*='/medecin/']",
+        "a[href*='/medecin-generaliste/']",
+        "a[href*='/praticien/']",
+        "a[href*='/sante/']",
+        "a[href*='/centre-']",
+        "a[href^='/cabinet-medical']",
+        "a[href^='/']",
+    ]
+    for sel in selecteurs:
+        try:
+            a = med.find_element(By.CSS_SELECTOR, sel)
+            href = a.get_attribute("href") or a.get_attribute("data-href")
+            if href and not href.startswith("javascript"):
+                return href
+        except:
+            continue
+
+    # un lien qui entoure un titre (h1/h2/h3)
+    try:
+        a = med.find_element(By.XPATH, ".//a[.//h1 or .//h2 or .//h3]")
+        href = a.get_attribute("href")
+        if href:
+            return href
+    except:
+        pass
+
+    # fallback: chercher premier <a> pertinent
+    for a in med.find_elements(By.TAG_NAME, "a"):
+        href = a.get_attribute("href") or ""
+        if href and not href.startswith("javascript:"):
+            if "/medecin/" in href or "/praticien/" in href or "/sante/" in href or href.startswith("/"):
+                return href
+    return None
+
+def extraire_depuis_fiche(driver):
+    """
+    Extrait les infos depuis la fiche ouverte (onglet actif).
+    `driver` peut aussi être une page HTML hors navigateur (page_html.PageHTML).
+    """
+    nom = None
+    dispo = "Non disponible"
+    type_consult = None
+    secteur_txt = None
+    prix = None
+    rue = None
+    code_postal = None
+    ville = None
+
+    # Nom
+    for sel in ["h1", "h1[data-testid='practitioner-name']", "h1[itemprop='name']"]:
+        try:
+            nom = driver.find_element(By.CSS_SELECTOR, sel).text.strip()
+            break
+        except:
+            continue
+
+    # Disponibilité (plusieurs tests)
+    dispo_try = [
+        "div[data-testid='next-availability']",
+        "div[data-test-id='search-result-availability']",
+        "div.availability",
+        "//div[contains(., 'Prochaine') or contains(., 'Prochain')]"  # XPath fallback
+    ]
+    for sel in dispo_try:
+        try:
+            if sel.startswith("//"):
+                dispo = driver.find_element(By.XPATH, sel).text.strip()
+            else:
+                dispo = driver.find_element(By.CSS_SELECTOR, sel).text.strip()
+            break
+        except:
+            continue
+
+    # Type de consultation : chercher le mot "téléconsultation"
+    page_text = driver.page_source.lower()
+    type_consult = "Téléconsultation" if "téléconsultation" in page_text or "téléconsult" in page_text else "En cabinet"
+
+    # Spécialité / secteur
+    spec_try = [
+        "div[data-testid='speciality']",
+        "div[data-test-id='search-result-card-content']",
+        "div.speciality",
+        "p.speciality"
+    ]
+    specialite = None
+    for sel in spec_try:
+        try:
+            specialite = driver.find_element(By.CSS_SELECTOR, sel).text
+            break
+        except:
+            continue
+    if specialite:
+        if "Secteur 1" in specialite:
+            secteur_txt = "1"
+        elif "Secteur 2" in specialite:
+            secteur_txt = "2"
+        elif "Non conventionné" in specialite or "non-conventionné" in specialite.lower():
+            secteur_txt = "Non conventionné"
+
+    # Adresse
+    addr_try = [
+        "div[data-testid='address']",
+        "div[data-test-id='search-result-card-address']",
+        "address",
+        "p.address"
+    ]
+    adresse_txt = None
+    for sel in addr_try:
+        try:
+            adresse_txt = driver.find_element(By.CSS_SELECTOR, sel).text.strip()
+            break
+        except:
+            continue
+    if adresse_txt:
+        parts = adresse_txt.split("\n")
+        rue = parts[0] if len(parts) >= 1 else None
+        if len(parts) >= 2:
+            second = parts[1].strip()
+            sp = second.split()
+            if sp:
+                code_postal = sp[0]
+                ville = " ".join(sp[1:]) if len(sp) > 1 else None
+
+    # Prix : scanner tous les spans / p à la recherche de "€"
+    try:
+        for el in driver.find_elements(By.XPATH, "//span|//p|//div"):
+            text = el.text.strip()
+            if "€" in text and any(ch.isdigit() for ch in text):
+                prix = text
+                break
+    except:
+        prix = None
+
+    return {
+        "Nom": nom,
+        "Disponibilité": dispo,
+        "Consultation": type_consult,
+        "Secteur": secteur_txt,
+        "Prix": prix,
+        "Rue": rue,
+        "Code postal": code_postal,
+        "Ville": ville
+    }
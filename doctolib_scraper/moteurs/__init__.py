@@ -0,0 +1,24 @@
+"""
+Moteurs de récupération des fiches praticiens.
+
+Chaque moteur vit dans son propre module, importé seulement à la demande par
+charger_moteur : choisir le moteur HTTP ou archive n'importe jamais Selenium.
+"""
+import importlib
+
+from doctolib_scraper.moteurs.base import Moteur
+
+# nom -> (module, classe)
+MOTEURS = {
+    "selenium": ("doctolib_scraper.moteurs.navigateur", "MoteurSelenium"),
+    "http": ("doctolib_scraper.moteurs.http", "MoteurHTTP"),
+    "archive": ("doctolib_scraper.moteurs.rejeu", "MoteurArchive"),
+}
+
+def charger_moteur(nom):
+    """Retourne la classe du moteur `nom`, en important son module à ce moment-là."""
+    try:
+        module, classe = MOTEURS[nom]
+    except KeyError:
+        raise ValueError(f"Moteur inconnu : {nom} (choix : {', '.join(MOTEURS)})")
+    return getattr(importlib.import_module(module), classe)
@@ -0,0 +1,30 @@
+class Moteur:
+    """
+    Source de fiches praticiens. `rechercher` produit un dict par fiche
+    (colonnes de stockage.COLONNES). Si une archive (archive.ArchiveHTML) est
+    fournie, les pages récupérées y sont enregistrées au passage.
+    """
+
+    def __init__(self, archive=None):
+        self.archive = archive
+
+    def rechercher(self, requete, lieu=None, nb_max=10, secteur=None, consultation=None):
+        raise NotImplementedError
+
+    def archiver(self, url, type_page, html):
+        # l'archive est facultative : une erreur d'écriture ne doit pas coûter la fiche
+        if self.archive is None:
+            return
+        try:
+            self.archive.ajouter(url, type_page, html)
+        except Exception as e:
+            print(f"⚠️ Archivage impossible pour {url} :", e)
+
+    def fermer(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
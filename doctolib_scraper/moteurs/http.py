@@ -0,0 +1,90 @@
+import re
+import time
+import unicodedata
+from urllib.parse import urljoin
+import requests
+
+from doctolib_scraper import BASE_URL
+from doctolib_scraper.extraction import By, SELECTEURS_CARTES, trouver_url_fiche, extraire_depuis_fiche
+from doctolib_scraper.moteurs.base import Moteur
+from doctolib_scraper.page_html import PageHTML, PageIllisible
+
+META_CHARSET = re.compile(rb"""<meta[^>]+charset=["']?([\w-]+)""", re.IGNORECASE)
+
+USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+
+def slug(texte):
+    """'Médecin généraliste' -> 'medecin-generaliste' (format des URLs Doctolib)."""
+    texte = unicodedata.normalize("NFKD", texte).encode("ascii", "ignore").decode()
+    return "-".join(texte.lower().split())
+
+
+def decoder(r):
+    """
+    Texte de la réponse. Sans charset dans l'en-tête, requests suppose ISO-8859-1 :
+    on suit plutôt le <meta charset> de la page, sinon UTF-8.
+    """
+    if "charset=" in r.headers.get("Content-Type", "").lower():
+        return r.text
+    m = META_CHARSET.search(r.content[:4096])
+    encodage = m.group(1).decode("ascii") if m else "utf-8"
+    try:
+        return r.content.decode(encodage, errors="replace")
+    except LookupError:
+        return r.content.decode("utf-8", errors="replace")
+
+
+class MoteurHTTP(Moteur):
+    """
+    Récupère les pages par simples requêtes HTTP, sans navigateur.
+    Ne voit que le HTML servi par le site (pas le contenu rendu en JavaScript).
+    """
+
+    def __init__(self, archive=None, delai=0.6, timeout=15):
+        super().__init__(archive)
+        self.delai = delai
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = USER_AGENT
+
+    def fermer(self):
+        self.session.close()
+
+    def _page(self, url, type_page):
+        r = self.session.get(url, timeout=self.timeout)
+        r.raise_for_status()
+        html = decoder(r)
+        self.archiver(r.url, type_page, html)
+        time.sleep(self.delai)
+        return PageHTML(html)
+
+    def rechercher(self, requete, lieu=None, nb_max=10, secteur=None, consultation=None):
+        chemin = "/" + slug(requete) + ("/" + slug(lieu) if lieu else "")
+        try:
+            page = self._page(urljoin(BASE_URL, chemin), "recherche")
+        except (requests.RequestException, PageIllisible) as e:
+            print("❌ Erreur sur la page de recherche :", e)
+            return
+
+        medecins = []
+        for sel in SELECTEURS_CARTES:
+            medecins = page.find_elements(By.CSS_SELECTOR, sel)
+            if medecins:
+                print(f"✅ {len(medecins)} médecins trouvés avec le sélecteur {sel}")
+                break
+        else:
+            print("⚠️ Aucun résultat détecté avec les sélecteurs connus.")
+            return
+
+        for idx, med in enumerate(medecins[:nb_max], start=1):
+            print(f"--- Traitement résultat {idx}/{min(nb_max, len(medecins))} ---")
+            href = trouver_url_fiche(med)
+            if not href:
+                print("⚠️ Aucun lien pour ce résultat.")
+                continue
+            try:
+                fiche = self._page(urljoin(BASE_URL, href), "fiche")
+            except (requests.RequestException, PageIllisible) as e:
+                print("⚠️ Erreur sur un praticien :", e)
+                continue
+            yield extraire_depuis_fiche(fiche)
@@ -0,0 +1,209 @@
+import time
+from urllib.parse import urljoin
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from webdriver_manager.chrome import ChromeDriverManager
+from selenium.webdriver.chrome.options import Options
+
+from doctolib_scraper import BASE_URL
+from doctolib_scraper.extraction import SELECTEURS_CARTES, trouver_url_fiche, extraire_depuis_fiche
+from doctolib_scraper.moteurs.base import Moteur
+
+# libellés des filtres cliquables sur la page de résultats
+LIBELLES_SECTEUR = {"1": "Secteur 1", "2": "Secteur 2", "Non conventionné": "Non conventionné"}
+LIBELLES_CONSULTATION = {"Téléconsultation": "Téléconsultation", "En cabinet": "En cabinet"}
+
+def get_driver(headless=False):
+    opts = Options()
+    # désactiver la géolocalisation et quelques options utiles
+    prefs = {"profile.default_content_setting_values.geolocation": 2}
+    opts.add_experimental_option("prefs", prefs)
+    opts.add_argument("--disable-geolocation")
+    if headless:
+        opts.add_argument("--headless=new")
+    service = Service(ChromeDriverManager().install())
+    driver = webdriver.Chrome(service=service, options=opts)
+    driver.maximize_window()
+    return driver
+
+def click_cookie_if_present(wait):
+    # plusieurs IDs possibles -> on essaye de fermer l'avis cookies si présent
+    cookie_selectors = [
+        (By.ID, "didomi-notice-disagree-button"),
+        (By.ID, "didomi-notice-agree-button"),
+        (By.CSS_SELECTOR, "button[aria-label='close']"),
+    ]
+    for by, sel in cookie_selectors:
+        try:
+            btn = wait.until(EC.element_to_be_clickable((by, sel)))
+            btn.click()
+            time.sleep(0.5)
+        except:
+            continue
+
+def find_search_inputs(wait, driver):
+    """Retourne (search_input, location_input). Essaie plusieurs sélecteurs."""
+    search_input = None
+    location_input = None
+
+    # location first — plus fiable d'entrer la localisation avant la requête
+    loc_try = [
+        (By.CSS_SELECTOR, "input[data-testid='search-bar-location-input']"),
+        (By.CSS_SELECTOR, "input[aria-label*='localisation']"),
+        (By.CSS_SELECTOR, "input[placeholder*='Votre ville']"),
+        (By.CSS_SELECTOR, "input[placeholder*='Code postal']"),
+    ]
+    for by, sel in loc_try:
+        try:
+            location_input = wait.until(EC.presence_of_element_located((by, sel)))
+            print(f"DEBUG: localisation input trouvé avec {sel}")
+            break
+        except:
+            continue
+
+    search_try = [
+        (By.CSS_SELECTOR, "input[placeholder*='Nom, spécialité, établissement']"),
+        (By.ID, "search-bar-main"),
+        (By.CSS_SELECTOR, "input[aria-label*='Rechercher']"),
+        (By.TAG_NAME, "input"),
+    ]
+    for by, sel in search_try:
+        try:
+            elem = wait.until(EC.presence_of_element_located((by, sel)))
+            # heuristique : choisir l'input visible et enabled
+            if elem.is_displayed() and elem.is_enabled():
+                search_input = elem
+                print(f"DEBUG: search input trouvé avec {sel}")
+                break
+        except:
+            continue
+
+    return search_input, location_input
+
+def type_location(location_input, location):
+    """Ecrase la localisation automatique et sélectionne la suggestion si possible."""
+    try:
+        location_input.clear()
+        time.sleep(0.2)
+        location_input.send_keys(location)
+        time.sleep(0.6)
+        # tenter de sélectionner la première suggestion
+        location_input.send_keys(Keys.DOWN)
+        time.sleep(0.2)
+        location_input.send_keys(Keys.ENTER)
+        time.sleep(0.8)
+        return True
+    except Exception as e:
+        print("DEBUG: impossible de saisir la localisation:", e)
+        return False
+
+def cliquer_filtre(driver, libelle):
+    try:
+        driver.find_element(By.XPATH, f"//span[contains(text(),'{libelle}')]").click()
+    except:
+        print(f"DEBUG: filtre '{libelle}' introuvable, ignoré.")
+
+def find_result_cards(driver):
+    """Essaie plusieurs sélecteurs de cartes résultats et retourne la liste."""
+    wait = WebDriverWait(driver, 10)
+    for sel in SELECTEURS_CARTES:
+        try:
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, sel)))
+            cards = driver.find_elements(By.CSS_SELECTOR, sel)
+            if cards:
+                print(f"✅ {len(cards)} médecins trouvés avec le sélecteur {sel}")
+                return cards
+        except Exception:
+            print(f"❌ Aucun élément trouvé avec {sel}")
+            continue
+    print("⚠️ Aucun résultat détecté avec les sélecteurs connus.")
+    return []
+
+
+class MoteurSelenium(Moteur):
+    """Pilote un Chrome via Selenium : saisie de la recherche, filtres, ouverture des fiches."""
+
+    def __init__(self, archive=None, headless=False):
+        super().__init__(archive)
+        self.driver = get_driver(headless)
+        self.wait = WebDriverWait(self.driver, 30)
+
+    def fermer(self):
+        self.driver.quit()
+
+    def rechercher(self, requete, lieu=None, nb_max=10, secteur=None, consultation=None):
+        driver = self.driver
+        driver.get(BASE_URL)
+        click_cookie_if_present(self.wait)
+
+        # trouver inputs
+        search_input, location_input = find_search_inputs(self.wait, driver)
+        if location_input and lieu:
+            if not type_location(location_input, lieu):
+                print("DEBUG: échec saisie localisation — on continue avec localisation par défaut du site.")
+        else:
+            print("DEBUG: champ localisation introuvable ou non renseigné, on laisse valeur par défaut.")
+
+        # taper la requête
+        if not search_input:
+            print("ERROR: Champ recherche introuvable.")
+            return
+        search_input.clear()
+        time.sleep(0.2)
+        search_input.send_keys(requete)
+        time.sleep(0.5)
+        search_input.send_keys(Keys.ENTER)
+
+        # attendre résultats puis appliquer les filtres du site
+        time.sleep(2)
+        if secteur in LIBELLES_SECTEUR:
+            cliquer_filtre(driver, LIBELLES_SECTEUR[secteur])
+        if consultation in LIBELLES_CONSULTATION:
+            cliquer_filtre(driver, LIBELLES_CONSULTATION[consultation])
+
+        medecins = find_result_cards(driver)
+        if not medecins:
+            print("❌ Aucun médecin détecté — vérifie la recherche sur le navigateur.")
+            # debug : dump un petit extrait du HTML
+            print(driver.page_source[:2000])
+            return
+        self.archiver(driver.current_url, "recherche", driver.page_source)
+
+        # parcourir résultats (limité à nb_max)
+        for idx, med in enumerate(medecins[:nb_max], start=1):
+            print(f"--- Traitement résultat {idx}/{min(nb_max, len(medecins))} ---")
+            try:
+                href = trouver_url_fiche(med)
+                print("DEBUG: href détecté =", href)
+                if not href:
+                    print("⚠️ Aucun lien pour ce résultat — outerHTML (tronc):")
+                    print(med.get_attribute("outerHTML")[:500])
+                    continue
+
+                # ouvrir dans nouvel onglet et extraire
+                url = urljoin(BASE_URL, href)
+                driver.execute_script("window.open(arguments[0], '_blank');", url)
+                driver.switch_to.window(driver.window_handles[-1])
+
+                # attendre que la fiche charge (ou timeout)
+                try:
+                    WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.CSS_SELECTOR, "h1")))
+                except:
+                    print("DEBUG: h1 introuvable après ouverture (possible lenteur). On continue l'extraction avec fallback.")
+
+                data = extraire_depuis_fiche(driver)
+                self.archiver(url, "fiche", driver.page_source)
+            except Exception as e:
+                print("⚠️ Erreur sur un praticien :", e)
+                continue
+            finally:
+                # fermer onglet fiche et revenir à la liste
+                if len(driver.window_handles) > 1:
+                    driver.close()
+                    driver.switch_to.window(driver.window_handles[0])
+                time.sleep(0.6)
+            yield data
@@ -0,0 +1,61 @@
+import os
+import time
+
+from doctolib_scraper.archive import ArchiveHTML
+from doctolib_scraper.extraction import extraire_depuis_fiche
+from doctolib_scraper.moteurs.base import Moteur
+
+# état propre à chaque processus du pool ; lxml n'est chargé que dans ceux-ci
+_archive = None
+PageHTML = None
+
+def _init_processus(dossier):
+    global _archive, PageHTML
+    from doctolib_scraper.page_html import PageHTML
+    _archive = ArchiveHTML(dossier)
+
+def _extraire(empreinte):
+    try:
+        return extraire_depuis_fiche(PageHTML(_archive.lire(empreinte)))
+    except Exception as e:
+        print(f"⚠️ Erreur sur la page archivée {empreinte} :", e)
+        return None
+
+
+class MoteurArchive(Moteur):
+    """
+    Relance l'extraction sur les fiches d'une archive (archive.ArchiveHTML),
+    sans réseau ni navigateur, en répartissant les pages sur tous les cœurs.
+    Les critères de recherche sont ignorés : toute l'archive est rejouée.
+    """
+
+    def __init__(self, archive, nb_processus=None):
+        super().__init__(archive)
+        self.nb_processus = nb_processus or os.cpu_count()
+
+    def archiver(self, url, type_page, html):
+        # l'archive est la source : rien à y ajouter
+        pass
+
+    def rechercher(self, requete=None, lieu=None, nb_max=None, secteur=None, consultation=None):
+        # dernière version archivée de chaque fiche
+        fiches = {}
+        for entree in self.archive.entrees("fiche"):
+            fiches[entree["url"]] = entree["sha256"]
+        empreintes = list(dict.fromkeys(fiches.values()))[:nb_max]
+        if not empreintes:
+            print("❌ Aucune fiche dans l'archive.")
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        debut = time.perf_counter()
+        n = 0
+        with ProcessPoolExecutor(max_workers=self.nb_processus, initializer=_init_processus,
+                                 initargs=(self.archive.dossier,)) as pool:
+            chunksize = max(1, len(empreintes) // (self.nb_processus * 8))
+            for data in pool.map(_extraire, empreintes, chunksize=chunksize):
+                if data:
+                    n += 1
+                    yield data
+        print(f"✅ {n} fiches ré-extraites en {time.perf_counter() - debut:.1f}s")
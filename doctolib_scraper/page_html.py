@@ -0,0 +1,98 @@
+import re
+from functools import lru_cache
+import lxml.etree
+import lxml.html
+# lxml.html.cssselect() a besoin du paquet cssselect : échouer ici plutôt que
+# dans les except de extraire_depuis_fiche
+from lxml.cssselect import CSSSelector
+
+from doctolib_scraper.extraction import By
+
+# éléments qui provoquent un retour à la ligne dans le texte rendu (comme WebElement.text)
+BALISES_BLOC = {
+    "address", "article", "aside", "br", "dd", "div", "dl", "dt", "footer", "form",
+    "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol",
+    "p", "section", "table", "tr", "ul",
+}
+BALISES_IGNOREES = {"head", "noscript", "script", "style", "template"}
+
+# lxml refuse une chaîne unicode qui porte encore sa déclaration d'encodage
+DECLARATION_XML = re.compile(r"^\s*<\?xml[^>]*\?>")
+
+
+@lru_cache(maxsize=None)
+def _selecteur_css(sel):
+    return CSSSelector(sel, translator="html")
+
+
+class ElementIntrouvable(Exception):
+    pass
+
+
+class PageIllisible(Exception):
+    pass
+
+
+class ElementHTML:
+    """
+    Élément d'une page HTML hors navigateur exposant la partie de l'API Selenium utilisée
+    par extraire_depuis_fiche / trouver_url_fiche (find_element(s), text, get_attribute).
+    """
+
+    def __init__(self, el):
+        self._el = el
+
+    def find_elements(self, by, sel):
+        if by == By.CSS_SELECTOR:
+            trouves = _selecteur_css(sel)(self._el)
+        elif by == By.XPATH:
+            trouves = [e for e in self._el.xpath(sel) if isinstance(e, lxml.html.HtmlElement)]
+        elif by == By.TAG_NAME:
+            trouves = self._el.iterdescendants(sel)
+        else:
+            raise ValueError(f"Stratégie de recherche non supportée : {by}")
+        return [ElementHTML(e) for e in trouves]
+
+    def find_element(self, by, sel):
+        trouves = self.find_elements(by, sel)
+        if not trouves:
+            raise ElementIntrouvable(f"{by} {sel}")
+        return trouves[0]
+
+    def get_attribute(self, nom):
+        return self._el.get(nom)
+
+    @property
+    def text(self):
+        morceaux = []
+
+        def parcourir(e):
+            if not isinstance(e.tag, str) or e.tag in BALISES_IGNOREES:
+                return
+            bloc = e.tag in BALISES_BLOC
+            if bloc:
+                morceaux.append("\n")
+            if e.text:
+                morceaux.append(e.text)
+            for enfant in e:
+                parcourir(enfant)
+                if enfant.tail:
+                    morceaux.append(enfant.tail)
+            if bloc:
+                morceaux.append("\n")
+
+        parcourir(self._el)
+        lignes = (" ".join(l.split()) for l in "".join(morceaux).split("\n"))
+        return "\n".join(l for l in lignes if l)
+
+
+class PageHTML(ElementHTML):
+    """Page HTML (archivée ou téléchargée), utilisable à la place du driver pour l'extraction."""
+
+    def __init__(self, html):
+        try:
+            racine = lxml.html.document_fromstring(DECLARATION_XML.sub("", html, count=1))
+        except (lxml.etree.ParserError, ValueError) as e:
+            raise PageIllisible(e) from e
+        super().__init__(racine)
+        self.page_source = html
@@ -0,0 +1,27 @@
+import csv
+
+COLONNES = ["Nom", "Disponibilité", "Consultation", "Secteur", "Prix", "Rue", "Code postal", "Ville"]
+
+def sauvegarder_csv(results, filename="medecins.csv"):
+    with open(filename, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=COLONNES)
+        writer.writeheader()
+        for r in results:
+            # s'assurer que toutes les clés existent
+            row = {k: r.get(k, "") for k in COLONNES}
+            writer.writerow(row)
+
+def lire_csv(filename="medecins.csv"):
+    with open(filename, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+def filtrer(results, secteur=None, consultation=None, ville=None):
+    """Filtre des résultats déjà extraits (valeurs au format des colonnes CSV)."""
+    for r in results:
+        if secteur and r.get("Secteur") != secteur:
+            continue
+        if consultation and r.get("Consultation") != consultation:
+            continue
+        if ville and ville.lower() not in (r.get("Ville") or "").lower():
+            continue
+        yield r
@@ -0,0 +1,64 @@
+import os
+import zstandard
+
+from doctolib_scraper.archive import ArchiveHTML
+
+
+def page(i):
+    lignes = "".join(f"<li>Consultation {j} : {20 + (i * j) % 50} €</li>" for j in range(30))
+    return (f"<html><head><title>Dr {i} - Doctolib</title></head><body>"
+            f"<h1>Dr Praticien {i}</h1><div data-testid='address'>{i} rue X<br>750{i % 20:02d} Paris</div>"
+            f"<ul>{lignes}</ul></body></html>")
+
+def dict_id(archive, empreinte):
+    with open(archive._chemin_objet(empreinte), "rb") as f:
+        return zstandard.get_frame_parameters(f.read()).dict_id
+
+
+def test_ajouter_lire_sans_dictionnaire(tmp_path):
+    archive = ArchiveHTML(str(tmp_path))
+    html = page(1)
+    empreinte = archive.ajouter("https://www.doctolib.fr/d/1", "fiche", html)
+    assert archive.lire(empreinte) == html
+    assert dict_id(archive, empreinte) == 0
+    # même contenu : un seul objet, deux entrées d'index
+    assert archive.ajouter("https://www.doctolib.fr/d/1bis", "fiche", html) == empreinte
+    assert archive.nb_objets() == 1
+    assert [e["url"] for e in archive.entrees("fiche")] == ["https://www.doctolib.fr/d/1", "https://www.doctolib.fr/d/1bis"]
+    assert list(archive.entrees("recherche")) == []
+
+
+def test_dictionnaire_entraine_automatiquement(tmp_path):
+    archive = ArchiveHTML(str(tmp_path), taille_echantillon=60)
+    pages = {archive.ajouter(f"u{i}", "fiche", page(i)): page(i) for i in range(60)}
+    assert archive._dict_courant is not None
+    for empreinte, html in pages.items():
+        assert dict_id(archive, empreinte) == archive._dict_courant
+        assert archive.lire(empreinte) == html
+
+    # après réouverture, les nouvelles pages utilisent le dictionnaire courant
+    archive = ArchiveHTML(str(tmp_path), taille_echantillon=60)
+    empreinte = archive.ajouter("u60", "fiche", page(60))
+    assert dict_id(archive, empreinte) == archive._dict_courant
+    assert archive.lire(empreinte) == page(60)
+
+
+def test_ancien_dictionnaire_reste_lisible(tmp_path):
+    archive = ArchiveHTML(str(tmp_path), taille_echantillon=60)
+    empreintes = [archive.ajouter(f"u{i}", "fiche", page(i)) for i in range(60)]
+    ancien = archive._dict_courant
+    with open(archive._chemin_objet(empreintes[0]), "rb") as f:
+        trame_ancienne = f.read()
+
+    nouveau = archive.entrainer_dictionnaire(taille=1024)
+    assert nouveau != ancien
+    assert dict_id(archive, empreintes[1]) == nouveau
+
+    with open(archive._chemin_objet(empreintes[0]), "wb") as f:
+        f.write(trame_ancienne)
+    assert ArchiveHTML(str(tmp_path)).lire(empreintes[0]) == page(0)
+
+
+def test_ouvrir_ne_cree_rien(tmp_path):
+    ArchiveHTML(str(tmp_path))
+    assert os.listdir(tmp_path) == []
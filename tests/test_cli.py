@@ -0,0 +1,74 @@
+import os
+import pytest
+
+from doctolib_scraper.archive import ArchiveHTML
+from doctolib_scraper.cli import main
+from doctolib_scraper.stockage import COLONNES, sauvegarder_csv, lire_csv
+
+FICHE = os.path.join(os.path.dirname(__file__), "fixtures", "fiche.html")
+
+RESULTATS = [
+    {"Nom": "Dr A", "Consultation": "En cabinet", "Secteur": "1", "Ville": "Paris"},
+    {"Nom": "Dr B", "Consultation": "Téléconsultation", "Secteur": "2", "Ville": "Lyon"},
+    {"Nom": "Dr C", "Consultation": "En cabinet", "Secteur": "Non conventionné", "Ville": "Paris 15e"},
+]
+
+
+def noms_affiches(sortie):
+    return [ligne.split(" | ")[0] for ligne in sortie.splitlines() if " | " in ligne]
+
+
+def test_resultats_filtres(tmp_path, capsys):
+    fichier = str(tmp_path / "medecins.csv")
+    sauvegarder_csv(RESULTATS, fichier)
+
+    main(["resultats", fichier])
+    assert noms_affiches(capsys.readouterr().out) == ["Dr A", "Dr B", "Dr C"]
+    main(["resultats", fichier, "--ville", "paris"])
+    assert noms_affiches(capsys.readouterr().out) == ["Dr A", "Dr C"]
+    main(["resultats", fichier, "--secteur", "non-conventionne"])
+    assert noms_affiches(capsys.readouterr().out) == ["Dr C"]
+    main(["resultats", fichier, "--consultation", "cabinet", "--secteur", "1"])
+    assert noms_affiches(capsys.readouterr().out) == ["Dr A"]
+
+
+def test_rejouer(tmp_path):
+    dossier = str(tmp_path / "archive")
+    sortie = str(tmp_path / "rejoues.csv")
+    with open(FICHE, encoding="utf-8") as f:
+        fiche = f.read()
+    archive = ArchiveHTML(dossier)
+    archive.ajouter("https://www.doctolib.fr/dermatologue/paris", "recherche", "<html><body>liste</body></html>")
+    archive.ajouter("https://www.doctolib.fr/dermatologue/paris/jeanne-martin", "fiche", fiche)
+    # la même fiche récupérée deux fois n'est rejouée qu'une fois
+    archive.ajouter("https://www.doctolib.fr/dermatologue/paris/jeanne-martin", "fiche", fiche)
+
+    main(["rejouer", dossier, "--processus", "2", "--sortie", sortie])
+    assert lire_csv(sortie) == [dict(zip(COLONNES, [
+        "Dr Jeanne Martin", "Prochain RDV le 12 octobre", "En cabinet", "1",
+        "Consultation : 50 €", "12 rue de la Paix", "75002", "Paris",
+    ]))]
+
+
+def test_rejouer_sans_archive(tmp_path):
+    sortie = tmp_path / "rejoues.csv"
+    with pytest.raises(SystemExit):
+        main(["rejouer", str(tmp_path), "--sortie", str(sortie)])
+    assert os.listdir(tmp_path) == []
+
+
+def test_rejouer_archive_sans_fiche(tmp_path):
+    dossier = str(tmp_path / "archive")
+    sortie = tmp_path / "rejoues.csv"
+    ArchiveHTML(dossier).ajouter("https://www.doctolib.fr/dermatologue/paris", "recherche", "<html></html>")
+    with pytest.raises(SystemExit):
+        main(["rejouer", dossier, "--sortie", str(sortie)])
+    assert not sortie.exists()
+
+
+@pytest.mark.parametrize("processus", ["0", "-1", "deux"])
+def test_rejouer_processus_invalide(tmp_path, processus, capsys):
+    with pytest.raises(SystemExit) as e:
+        main(["rejouer", str(tmp_path), "--processus", processus])
+    assert e.value.code == 2
+    assert "--processus" in capsys.readouterr().err
@@ -0,0 +1,89 @@
+import os
+
+from doctolib_scraper.cli import _collecter
+from doctolib_scraper.moteurs.http import MoteurHTTP, decoder
+
+FICHE = os.path.join(os.path.dirname(__file__), "fixtures", "fiche.html")
+
+RECHERCHE = ("<html><body>"
+             "<div class='dl-card'><a href='/dermatologue/paris/vide'>Dr Vide</a></div>"
+             "<div class='dl-card'><a href='/dermatologue/paris/jeanne-martin'>Dr Martin</a></div>"
+             "</body></html>")
+
+
+class Reponse:
+    def __init__(self, url, content, content_type="text/html; charset=utf-8"):
+        self.url = url
+        self.content = content
+        self.headers = {"Content-Type": content_type}
+
+    @property
+    def text(self):
+        # comme requests : ISO-8859-1 par défaut pour text/*
+        charset = self.headers["Content-Type"].partition("charset=")[2] or "iso-8859-1"
+        return self.content.decode(charset)
+
+    def raise_for_status(self):
+        pass
+
+
+class Session:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def get(self, url, timeout=None):
+        return Reponse(url, *self.pages[url])
+
+    def close(self):
+        pass
+
+
+def moteur(pages, archive=None):
+    m = MoteurHTTP(archive=archive, delai=0)
+    m.session = Session(pages)
+    return m
+
+
+def test_page_illisible_ignoree():
+    with open(FICHE, "rb") as f:
+        fiche = f.read()
+    m = moteur({
+        "https://www.doctolib.fr/dermatologue/paris": (RECHERCHE.encode(),),
+        "https://www.doctolib.fr/dermatologue/paris/vide": (b"",),
+        "https://www.doctolib.fr/dermatologue/paris/jeanne-martin": (fiche,),
+    })
+    assert [r["Nom"] for r in m.rechercher("Dermatologue", "Paris")] == ["Dr Jeanne Martin"]
+
+
+def test_collecter_garde_les_resultats_partiels():
+    class Moteur:
+        def rechercher(self):
+            yield {"Nom": "Dr A"}
+            raise RuntimeError("boom")
+
+    assert _collecter(Moteur()) == [{"Nom": "Dr A"}]
+
+
+def test_decoder_suit_le_meta_charset():
+    html = '<html><head><meta charset="utf-8"></head><body>Médecin</body></html>'
+    assert decoder(Reponse("u", html.encode("utf-8"), "text/html")) == html
+    assert decoder(Reponse("u", "<p>Médecin</p>".encode("utf-8"), "text/html")) == "<p>Médecin</p>"
+    html = '<html><head><meta http-equiv="Content-Type" content="text/html; charset=iso-8859-1"></head>é</html>'
+    assert decoder(Reponse("u", html.encode("iso-8859-1"), "text/html")) == html
+    assert decoder(Reponse("u", "é".encode("iso-8859-1"), "text/html; charset=iso-8859-1")) == "é"
+
+
+def test_erreur_archive_ne_perd_pas_la_fiche(capsys):
+    class ArchivePleine:
+        def ajouter(self, url, type_page, html):
+            raise OSError("No space left on device")
+
+    with open(FICHE, "rb") as f:
+        fiche = f.read()
+    m = moteur({
+        "https://www.doctolib.fr/dermatologue/paris": (RECHERCHE.encode(),),
+        "https://www.doctolib.fr/dermatologue/paris/vide": (b"",),
+        "https://www.doctolib.fr/dermatologue/paris/jeanne-martin": (fiche,),
+    }, archive=ArchivePleine())
+    assert [r["Nom"] for r in m.rechercher("Dermatologue", "Paris")] == ["Dr Jeanne Martin"]
+    assert "Archivage impossible" in capsys.readouterr().out
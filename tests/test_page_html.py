@@ -0,0 +1,65 @@
+import os
+import pytest
+
+from doctolib_scraper.extraction import By, trouver_url_fiche, extraire_depuis_fiche
+from doctolib_scraper.page_html import PageHTML, ElementIntrouvable, PageIllisible
+
+FICHE = os.path.join(os.path.dirname(__file__), "fixtures", "fiche.html")
+
+
+@pytest.fixture
+def page():
+    with open(FICHE, encoding="utf-8") as f:
+        return PageHTML(f.read())
+
+
+def test_text_comme_selenium(page):
+    # espaces regroupés, retour à la ligne sur <br> et les blocs, <script> ignoré
+    assert page.find_element(By.CSS_SELECTOR, "h1").text == "Dr Jeanne Martin"
+    assert page.find_element(By.CSS_SELECTOR, "div[data-testid='address']").text == "12 rue de la Paix\n75002 Paris"
+    assert "Secteur 2" not in page.find_element(By.TAG_NAME, "body").text
+
+
+def test_find_elements(page):
+    assert [e.text for e in page.find_elements(By.TAG_NAME, "span")] == ["Conventionné Secteur 1", "Consultation : 50 €"]
+    assert page.find_element(By.XPATH, "//div[contains(., 'Prochain')]").text == "Prochain RDV le 12 octobre"
+    assert page.find_elements(By.CSS_SELECTOR, "div.inexistante") == []
+    with pytest.raises(ElementIntrouvable):
+        page.find_element(By.CSS_SELECTOR, "div.inexistante")
+    with pytest.raises(ValueError):
+        page.find_elements("link text", "Retour")
+
+
+def test_get_attribute(page):
+    a = page.find_element(By.CSS_SELECTOR, "a.retour")
+    assert a.get_attribute("href") == "/dermatologue/paris"
+    assert a.get_attribute("data-href") is None
+
+
+def test_trouver_url_fiche_lien_autour_du_titre():
+    carte = PageHTML("<div><a href='javascript:void(0)'>x</a>"
+                     "<a href='https://www.doctolib.fr/dermatologue/paris/jeanne-martin'><h2>Dr Martin</h2></a></div>")
+    assert trouver_url_fiche(carte) == "https://www.doctolib.fr/dermatologue/paris/jeanne-martin"
+
+
+def test_extraire_depuis_fiche(page):
+    assert extraire_depuis_fiche(page) == {
+        "Nom": "Dr Jeanne Martin",
+        "Disponibilité": "Prochain RDV le 12 octobre",
+        "Consultation": "En cabinet",
+        "Secteur": "1",
+        "Prix": "Consultation : 50 €",
+        "Rue": "12 rue de la Paix",
+        "Code postal": "75002",
+        "Ville": "Paris",
+    }
+
+
+def test_page_xhtml_avec_declaration():
+    page = PageHTML('<?xml version="1.0" encoding="utf-8"?>\n<html><body><h1>Dr Martin</h1></body></html>')
+    assert page.find_element(By.TAG_NAME, "h1").text == "Dr Martin"
+
+
+def test_page_illisible():
+    with pytest.raises(PageIllisible):
+        PageHTML("")